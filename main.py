@@ -29,6 +29,14 @@ import os
 import sys
 from datetime import datetime
 
+# Use uvloop when available - the pipeline is almost entirely await-bound,
+# so the libuv loop cuts per-callback overhead substantially.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -52,9 +60,9 @@ logging.basicConfig(
 logger = logging.getLogger('LeadSniper')
 
 
-def print_banner():
-    """Print system banner"""
-    banner = """
+# Encoded once at import; print_banner just writes the bytes, so daemon
+# restarts under a process manager don't re-encode the banner each time.
+_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                              ║
 ║     ██╗     ███████╗ █████╗ ██████╗     ███████╗███╗   ██╗██╗██████╗ ███████╗██████╗  ║
@@ -70,8 +78,16 @@ def print_banner():
 ║     Powered by: Manus Core | Vision Cortex | Vertex AI | AutoML              ║
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    """.encode('utf-8')
+
+
+def print_banner():
+    """Print system banner (suppressed when NO_BANNER is set, e.g. daemon loops)"""
+    if os.environ.get('NO_BANNER'):
+        return
+    sys.stdout.buffer.write(_BANNER)
+    sys.stdout.buffer.write(b'\n')
+    sys.stdout.flush()
 
 
 async def run_once(config: PipelineConfig):
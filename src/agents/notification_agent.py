@@ -4,111 +4,189 @@ Lead Sniper - Alert and Notification System
 This component is responsible for sending multi-channel notifications for high-priority leads, integrating with Manus Core, Vision Cortex, and Vertex AI.
 '''
 
+import asyncio
 import os
 import json
-import requests
 import logging
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
-from twilio.rest import Client
-
-# Initialize logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
-# Load configuration
-with open('config.json', 'r') as config_file:
-    config = json.load(config_file)
-
-env = os.environ.get("LEAD_SNIPER_ENV", "development")
-app_config = config[env]
-
-# Configuration
-SENDGRID_API_KEY = app_config.get("sendgrid_api_key")
-TWILIO_ACCOUNT_SID = app_config.get("twilio_account_sid")
-TWILIO_AUTH_TOKEN = app_config.get("twilio_auth_token")
-TWILIO_PHONE_NUMBER = app_config.get("twilio_phone_number")
+import httpx
+from cachetools import TTLCache
+from dataclasses import dataclass
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+
+# Initialize logging - skip if the entry point already configured handlers,
+# otherwise every line gets written twice.
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Configuration - parsed and validated once at import into an immutable
+# typed object instead of re-indexing the raw dict per instantiation.
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    sendgrid_api_key: str = ""
+    twilio_account_sid: str = ""
+    twilio_auth_token: str = ""
+    twilio_phone_number: str = ""
+
+
+def _load_config() -> AppConfig:
+    with open('config.json', 'r') as config_file:
+        config = json.load(config_file)
+    env = os.environ.get("LEAD_SNIPER_ENV", "development")
+    app_config = config[env]
+    return AppConfig(
+        sendgrid_api_key=app_config.get("sendgrid_api_key", ""),
+        twilio_account_sid=app_config.get("twilio_account_sid", ""),
+        twilio_auth_token=app_config.get("twilio_auth_token", ""),
+        twilio_phone_number=app_config.get("twilio_phone_number", "")
+    )
+
+
+CFG = _load_config()
 
 class ManusCoreIntegration:
     def __init__(self):
         logging.info("Initializing Manus Core Integration")
+        # Repeat notifications for the same lead (retry/polling loops) should
+        # not re-issue the network call within the TTL window.
+        self._cache = TTLCache(maxsize=10_000, ttl=3600)
 
     def get_lead_context(self, lead_id):
-        logging.info(f"Fetching context for lead {lead_id} from Manus Core")
+        cached = self._cache.get(lead_id)
+        if cached is not None:
+            return cached
+        logging.info("Fetching context for lead %s from Manus Core", lead_id)
         # Placeholder for actual Manus Core API call
-        return {"manus_core_insight": "This lead is highly engaged."}
+        context = {"manus_core_insight": "This lead is highly engaged."}
+        self._cache[lead_id] = context
+        return context
+
+    def invalidate_lead(self, lead_id):
+        self._cache.pop(lead_id, None)
 
 class VisionCortexIntegration:
     def __init__(self):
         logging.info("Initializing Vision Cortex Integration")
+        # Keyed by image URL, not image bytes
+        self._cache = TTLCache(maxsize=10_000, ttl=3600)
 
     def analyze_lead_image(self, image_url):
-        logging.info(f"Analyzing image {image_url} with Vision Cortex")
+        cached = self._cache.get(image_url)
+        if cached is not None:
+            return cached
+        logging.info("Analyzing image %s with Vision Cortex", image_url)
         # Placeholder for actual Vision Cortex API call
-        return {"vision_cortex_insight": "Logo detected: Example Corp"}
+        analysis = {"vision_cortex_insight": "Logo detected: Example Corp"}
+        self._cache[image_url] = analysis
+        return analysis
+
+    def invalidate_image(self, image_url):
+        self._cache.pop(image_url, None)
 
 class VertexAIIntegration:
     def __init__(self):
         logging.info("Initializing Vertex AI Integration")
+        self._cache = TTLCache(maxsize=10_000, ttl=3600)
 
     def get_lead_score(self, lead_data):
-        logging.info(f"Scoring lead with Vertex AI")
+        lead_id = lead_data.get('id')
+        cached = self._cache.get(lead_id)
+        if cached is not None:
+            return cached
+        logging.info("Scoring lead with Vertex AI")
         # Placeholder for actual Vertex AI API call
-        return {"vertex_ai_score": 0.95}
+        score = {"vertex_ai_score": 0.95}
+        if lead_id is not None:
+            self._cache[lead_id] = score
+        return score
+
+    def invalidate_lead(self, lead_id):
+        self._cache.pop(lead_id, None)
+
+# Process-wide singletons: one keepalive-pooled HTTP client shared by every
+# channel, and one instance of each (stateless) integration so their caches
+# are shared across AlertAndNotificationSystem instances.
+HTTP_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    trust_env=False  # no proxy probing when none is configured
+)
+MANUS_CORE = ManusCoreIntegration()
+VISION_CORTEX = VisionCortexIntegration()
+VERTEX_AI = VertexAIIntegration()
 
 class AlertAndNotificationSystem:
     def __init__(self):
         '''
         Initializes the Alert and Notification System.
         '''
-        self.sendgrid_client = SendGridAPIClient(SENDGRID_API_KEY)
-        self.twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
-        self.manus_core = ManusCoreIntegration()
-        self.vision_cortex = VisionCortexIntegration()
-        self.vertex_ai = VertexAIIntegration()
+        self._http = HTTP_CLIENT
+        self.manus_core = MANUS_CORE
+        self.vision_cortex = VISION_CORTEX
+        self.vertex_ai = VERTEX_AI
 
-    def send_email(self, to_email, subject, content):
+    async def send_email(self, to_email, subject, content):
         '''
-        Sends an email notification.
+        Sends an email notification via the SendGrid REST API.
         '''
-        message = Mail(
-            from_email='alerts@leadsniper.com',
-            to_emails=to_email,
-            subject=subject,
-            html_content=content
-        )
+        payload = {
+            "personalizations": [{"to": [{"email": to_email}]}],
+            "from": {"email": "alerts@leadsniper.com"},
+            "subject": subject,
+            "content": [{"type": "text/html", "value": content}]
+        }
         try:
-            response = self.sendgrid_client.send(message)
-            logging.info(f"Email sent to {to_email} with status code {response.status_code}")
+            response = await self._http.post(
+                "https://api.sendgrid.com/v3/mail/send",
+                json=payload,
+                headers={"Authorization": f"Bearer {CFG.sendgrid_api_key}"}
+            )
+            logging.info("Email sent to %s with status code %s", to_email, response.status_code)
         except Exception as e:
-            logging.error(f"Error sending email: {e}")
+            logging.error("Error sending email: %s", e)
 
-    def send_sms(self, to_number, message):
+    async def send_sms(self, to_number, message):
         '''
-        Sends an SMS notification.
+        Sends an SMS notification via the Twilio REST API.
         '''
         try:
-            message = self.twilio_client.messages.create(
-                body=message,
-                from_=TWILIO_PHONE_NUMBER,
-                to=to_number
+            response = await self._http.post(
+                f"https://api.twilio.com/2010-04-01/Accounts/{CFG.twilio_account_sid}/Messages.json",
+                data={
+                    "Body": message,
+                    "From": CFG.twilio_phone_number,
+                    "To": to_number
+                },
+                auth=(CFG.twilio_account_sid, CFG.twilio_auth_token)
             )
-            logging.info(f"SMS sent to {to_number} with SID {message.sid}")
+            logging.info("SMS sent to %s with status code %s", to_number, response.status_code)
         except Exception as e:
-            logging.error(f"Error sending SMS: {e}")
-
-    def send_webhook(self, url, data):
+            logging.error("Error sending SMS: %s", e)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.2, max=2),
+        retry=retry_if_exception_type(httpx.TransportError),
+        reraise=True
+    )
+    async def _post_webhook(self, url, data):
+        # Only transport errors retry; 4xx/5xx responses return immediately
+        return await self._http.post(url, json=data, timeout=5)
+
+    async def send_webhook(self, url, data):
         '''
-        Sends a webhook notification.
+        Sends a webhook notification with bounded timeout and retry.
         '''
         try:
-            response = requests.post(url, json=data)
-            logging.info(f"Webhook sent to {url} with status code {response.status_code}")
+            response = await self._post_webhook(url, data)
+            logging.info("Webhook sent to %s with status code %s", url, response.status_code)
         except Exception as e:
-            logging.error(f"Error sending webhook: {e}")
+            logging.error("Error sending webhook: %s", e)
 
-    def process_notification(self, notification_data):
+    async def process_notification(self, notification_data):
         '''
-        Processes a notification request and sends it to the appropriate channels.
+        Processes a notification request and fans it out to the appropriate
+        channels concurrently.
         '''
         lead_data = notification_data.get('lead')
         notification_channels = notification_data.get('channels')
@@ -134,14 +212,26 @@ class AlertAndNotificationSystem:
         - Vertex AI Score: {lead_data['vertex_ai_score']['vertex_ai_score']}
         """
 
+        tasks = []
         if "email" in notification_channels:
-            self.send_email(notification_channels["email"], subject, content)
+            tasks.append(self.send_email(notification_channels["email"], subject, content))
 
         if "sms" in notification_channels:
-            self.send_sms(notification_channels["sms"], subject)
+            tasks.append(self.send_sms(notification_channels["sms"], subject))
 
         if "webhook" in notification_channels:
-            self.send_webhook(notification_channels["webhook"], lead_data)
+            tasks.append(self.send_webhook(notification_channels["webhook"], lead_data))
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def invalidate_lead(self, lead_id):
+        '''
+        Drops cached integration results for a lead. Call from the status
+        webhook when a lead changes so the next notification re-fetches.
+        '''
+        self.manus_core.invalidate_lead(lead_id)
+        self.vertex_ai.invalidate_lead(lead_id)
 
 if __name__ == "__main__":
     # Example usage
@@ -161,4 +251,4 @@ if __name__ == "__main__":
             "webhook": "https://example.com/webhook-endpoint"
         }
     }
-    notification_system.process_notification(example_notification)
+    asyncio.run(notification_system.process_notification(example_notification))
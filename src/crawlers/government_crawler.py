@@ -5,41 +5,91 @@ This script crawls government websites for foreclosure and tax lien data.
 It includes auto-heal, auto-fix, and auto-optimize features.
 '''
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import io
+import random
+import httpx
+from lxml import html as lxml_html
 import pandas as pd
 import time
-import schedule
+from datetime import datetime, timedelta
+
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36'
+
+# The hidden ASP.NET form fields stay valid for the session, so bulk
+# backfills can reuse them instead of paying a GET round-trip per month.
+VIEWSTATE_TTL_SECONDS = 1800
+_vs_cache = {}  # url -> (viewstate, viewstategen, eventvalidation, fetched_at)
+
+
+async def _get_form_fields(client, url, refresh=False):
+    '''Fetches (or returns cached) __VIEWSTATE/__VIEWSTATEGENERATOR/__EVENTVALIDATION.'''
+    if not refresh:
+        cached = _vs_cache.get(url)
+        if cached and time.time() - cached[3] < VIEWSTATE_TTL_SECONDS:
+            return cached[:3]
+
+    res = await client.get(url, timeout=30)
+    res.raise_for_status()
+    # lxml's C parser only has to feed three targeted xpath lookups here,
+    # where the old html.parser backend built the slowest full DOM
+    tree = lxml_html.fromstring(res.text)
+
+    viewstate = tree.xpath('//input[@name="__VIEWSTATE"]/@value')
+    eventvalidation = tree.xpath('//input[@name="__EVENTVALIDATION"]/@value')
+    viewstategen = tree.xpath('//input[@name="__VIEWSTATEGENERATOR"]/@value')
+
+    if not (viewstate and eventvalidation and viewstategen):
+        return None
+
+    _vs_cache[url] = (viewstate[0], viewstategen[0], eventvalidation[0], time.time())
+    return _vs_cache[url][:3]
 
 # --- Integration Points ---
-def manus_core_integration(data):
+async def manus_core_integration(data):
     '''Integrates with Manus Core.'''
     print("Integrating with Manus Core...")
     # In a real scenario, this would involve API calls to Manus Core
     print(data)
 
-def vision_cortex_integration(data):
+async def vision_cortex_integration(data):
     '''Integrates with Vision Cortex.'''
     print("Integrating with Vision Cortex...")
     # In a real scenario, this would involve API calls to Vision Cortex
     print(data)
 
-def vertex_ai_integration(data):
+async def vertex_ai_integration(data):
     '''Integrates with Vertex AI.'''
     print("Integrating with Vertex AI...")
     # In a real scenario, this would involve API calls to Vertex AI
     print(data)
 
 # --- Autonomous Features ---
+# Status codes worth retrying: rate limiting and transient server errors.
+# Anything else (404, parse bugs, auth) fails the same way on every attempt.
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def _is_retryable(exc):
+    if isinstance(exc, (httpx.ConnectError, httpx.TimeoutException)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS
+    return False
+
+
 def auto_heal(func, retries=3, delay=5):
-    '''Auto-heal mechanism with exponential backoff.'''
-    def wrapper(*args, **kwargs):
+    '''Auto-heal mechanism with jittered exponential backoff on transient errors.'''
+    async def wrapper(*args, **kwargs):
         for i in range(retries):
             try:
-                return func(*args, **kwargs)
-            except requests.exceptions.RequestException as e:
+                return await func(*args, **kwargs)
+            except httpx.HTTPError as e:
+                if not _is_retryable(e):
+                    raise
                 print(f"Attempt {i+1}/{retries} failed: {e}")
-                time.sleep(delay * (2 ** i))
+                # Jitter desynchronizes concurrent crawls retrying in lockstep
+                await asyncio.sleep(delay * (2 ** i) + random.random())
         print("All retries failed. Could not complete the request.")
         return None
     return wrapper
@@ -47,82 +97,107 @@ def auto_heal(func, retries=3, delay=5):
 def auto_fix(df):
     '''Auto-fix mechanism for data inconsistencies.'''
     print("Applying auto-fix to the data...")
-    # Example: Fill missing values with a placeholder
-    df.fillna("N/A", inplace=True)
-    # Example: Ensure data types are correct
-    for col in df.columns:
-        if "date" in col:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
+    # Fill missing values with a placeholder (inplace= forces a copy-on-write
+    # path in modern pandas, so assign the result instead)
+    df = df.fillna("N/A")
+    # Coerce all date-like columns in one vectorized pass instead of one
+    # pandas dispatch per column
+    date_cols = [col for col in df.columns if "date" in col]
+    if date_cols:
+        df[date_cols] = df[date_cols].apply(pd.to_datetime, errors='coerce')
     return df
 
 @auto_heal
-def get_foreclosure_data(year, month):
+async def get_foreclosure_data(client, year, month, sem):
     '''Gets foreclosure data for a given year and month.'''
     url = "https://www.cclerk.hctx.net/Applications/WebSearch/FRCL_R.aspx"
-    with requests.Session() as s:
-        s.headers['User-Agent'] = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36'
-        res = s.get(url, timeout=30)
-        res.raise_for_status()
-        soup = BeautifulSoup(res.text, 'html.parser')
-
-        viewstate = soup.find('input', {'name': '__VIEWSTATE'})
-        eventvalidation = soup.find('input', {'name': '__EVENTVALIDATION'})
-        viewstategen = soup.find('input', {'name': '__VIEWSTATEGENERATOR'})
-
-        if not all([viewstate, eventvalidation, viewstategen]):
+    # Bound concurrent requests per host so bulk backfills don't hammer the server
+    async with sem:
+        fields = await _get_form_fields(client, url)
+        if fields is None:
             print("Could not find all required form fields.")
             return
 
-        form_data = {
-            '__EVENTTARGET': '',
-            '__EVENTARGUMENT': '',
-            '__LASTFOCUS': '',
-            '__VIEWSTATE': viewstate.get('value'),
-            '__VIEWSTATEGENERATOR': viewstategen.get('value'),
-            '__EVENTVALIDATION': eventvalidation.get('value'),
-            'ctl00$ContentPlaceHolder1$txtFileNo': '',
-            'ctl00$ContentPlaceHolder1$rbtlDate': 'rbtlSaleDate',
-            'ctl00$ContentPlaceHolder1$ddlYear': year,
-            'ctl00$ContentPlaceHolder1$ddlMonth': month,
-            'ctl00$ContentPlaceHolder1$btnSearch': 'Search'
-        }
-
-        res = s.post(url, data=form_data, timeout=30)
-        res.raise_for_status()
-        soup = BeautifulSoup(res.text, 'html.parser')
-        table = soup.find('table', {'id': 'ctl00_ContentPlaceHolder1_gvDocuments'})
-
-        if table:
-            df = pd.read_html(str(table))[0]
-            df.columns = [col.lower().replace(' ', '_') for col in df.columns]
-            df = auto_fix(df)
-
-            print("--- Processed Data ---")
-            print(df)
-
-            manus_core_integration(df.to_dict('records'))
-            vision_cortex_integration(df.to_dict('records'))
-            vertex_ai_integration(df.to_dict('records'))
-        else:
-            print('No foreclosure data found for the selected date.')
-
-def job():
+        for attempt in range(2):
+            viewstate, viewstategen, eventvalidation = fields
+            form_data = {
+                '__EVENTTARGET': '',
+                '__EVENTARGUMENT': '',
+                '__LASTFOCUS': '',
+                '__VIEWSTATE': viewstate,
+                '__VIEWSTATEGENERATOR': viewstategen,
+                '__EVENTVALIDATION': eventvalidation,
+                'ctl00$ContentPlaceHolder1$txtFileNo': '',
+                'ctl00$ContentPlaceHolder1$rbtlDate': 'rbtlSaleDate',
+                'ctl00$ContentPlaceHolder1$ddlYear': year,
+                'ctl00$ContentPlaceHolder1$ddlMonth': month,
+                'ctl00$ContentPlaceHolder1$btnSearch': 'Search'
+            }
+
+            res = await client.post(url, data=form_data, timeout=30)
+            if res.status_code == 500 and attempt == 0:
+                # Stale viewstate - refetch once and retry the POST
+                fields = await _get_form_fields(client, url, refresh=True)
+                if fields is None:
+                    print("Could not find all required form fields.")
+                    return
+                continue
+            res.raise_for_status()
+            break
+
+    # Let pandas pull the target table straight from the response with its
+    # lxml backend - the old path parsed the page twice (xpath to find the
+    # table, tostring to re-serialize it for read_html)
+    try:
+        df = pd.read_html(
+            io.StringIO(res.text),
+            attrs={'id': 'ctl00_ContentPlaceHolder1_gvDocuments'},
+            flavor='lxml'
+        )[0]
+    except ValueError:
+        df = None
+
+    if df is not None:
+        df.columns = [col.lower().replace(' ', '_') for col in df.columns]
+        df = auto_fix(df)
+
+        print("--- Processed Data ---")
+        print(df)
+
+        # Materialize the records once - each to_dict('records') walks the
+        # whole frame, and the three integrations only read the result
+        records = df.to_dict('records')
+        await asyncio.gather(
+            manus_core_integration(records),
+            vision_cortex_integration(records),
+            vertex_ai_integration(records)
+        )
+    else:
+        print('No foreclosure data found for the selected date.')
+
+async def job():
     '''Scheduled job to run the crawler.'''
     print("Running scheduled job...")
     # Crawl data for the previous month
-    from datetime import datetime, timedelta
     today = datetime.today()
     first = today.replace(day=1)
     last_month = first - timedelta(days=1)
-    get_foreclosure_data(str(last_month.year), last_month.strftime('%B'))
+    sem = asyncio.Semaphore(100)
+    async with httpx.AsyncClient(http2=True, headers={'User-Agent': USER_AGENT}) as client:
+        await get_foreclosure_data(client, str(last_month.year), last_month.strftime('%B'), sem)
+
+async def main():
+    '''Runs the job immediately, then daily at 01:00.'''
+    await job()
+    # Sleep straight to the next run instead of polling schedule.run_pending()
+    # every second (86k wakeups/day doing nothing)
+    while True:
+        now = datetime.now()
+        next_run = now.replace(hour=1, minute=0, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        await asyncio.sleep((next_run - now).total_seconds())
+        await job()
 
 if __name__ == '__main__':
-    # Run the job once immediately
-    job()
-
-    # Schedule the job to run daily
-    schedule.every().day.at("01:00").do(job)
-
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    asyncio.run(main())
@@ -15,36 +15,53 @@ pipeline integrating all system components:
 7. Scheduled Execution (5 AM daily)
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
 import json
 import logging
 import os
+
+import aiofiles
+import numpy as np
+import orjson
+import pandas as pd
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, TYPE_CHECKING
+from zoneinfo import ZoneInfo
 from enum import Enum
 import hashlib
+import secrets
+import sqlite3
+import time
 
 # Import core modules
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.manus_core import (
-    ManusCore, SystemConfig, VisionCortexIntegration,
-    SmartRouter, TripleCheckValidator
-)
-from scrapers.headless_orchestrator import (
-    HeadlessOrchestrator, ScraperConfig, ScrapeTarget,
-    SiteType, ScraperMode
-)
-from vertex_ai.vertex_integration import (
-    VertexAIClient, AutoMLPredictor, BigQueryAnalytics,
-    FirestoreSync, VertexConfig
-)
+if TYPE_CHECKING:
+    from scrapers.headless_orchestrator import ScrapeTarget
 
 logger = logging.getLogger('AutonomousPipeline')
 
 
+@functools.lru_cache(maxsize=None)
+def _components():
+    """Import the heavy component stacks on first pipeline construction
+    
+    core.manus_core, scrapers.headless_orchestrator and
+    vertex_ai.vertex_integration pull in numba, playwright and the
+    google-cloud clients - seconds of import work the scheduler should
+    not pay at process start when its first run is hours away.
+    """
+    from core import manus_core
+    from scrapers import headless_orchestrator
+    from vertex_ai import vertex_integration
+    return manus_core, headless_orchestrator, vertex_integration
+
+
 class PipelineStage(Enum):
     """Pipeline execution stages"""
     INITIALIZATION = "initialization"
@@ -81,6 +98,9 @@ class PipelineConfig:
     triple_check_enabled: bool = True
     min_confidence_threshold: float = 0.7
     
+    # Analysis settings
+    analysis_cache_enabled: bool = True
+    
     # Storage settings
     store_to_bigquery: bool = True
     sync_to_firestore: bool = True
@@ -108,6 +128,107 @@ class PipelineResult:
     metrics: Dict = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class RawLead:
+    """Compact per-lead record flowing between pipeline stages
+    
+    A slotted dataclass instead of a five-key dict per scrape result:
+    no per-lead hash table, fixed attribute offsets for every stage that
+    reads scores and priorities, and roughly half the per-lead overhead
+    at 100k-lead volumes. The get/__iter__ shims keep it duck-type
+    compatible with the validator, Vision Cortex and Vertex boundaries,
+    which read leads via .get() and key-set checks; leads convert to
+    plain dicts only at the storage/report boundary via to_dict().
+    """
+    id: str
+    source_url: str
+    raw_data: Any
+    scraped_at: str
+    scrape_time_ms: float
+    validation: Optional[Dict] = None
+    vision_cortex: Optional[Dict] = None
+    vertex_ai: Optional[Dict] = None
+    ml_score: float = 0.0
+    ml_confidence: float = 0.0
+    model_version: str = ""
+    priority: str = 'LOW'
+    recommended_action: str = 'MONITOR'
+    enriched_at: str = ""
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access for the .get()-based consumers"""
+        return getattr(self, key, default)
+    
+    def __iter__(self):
+        # Iterating a lead yields its field names, like iterating a dict
+        return iter(self.__dataclass_fields__)
+    
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+# Priority -> action table shared across runs; the old helper rebuilt
+# this dict on every lead
+_ACTION_BY_PRIORITY = {
+    'CRITICAL': 'IMMEDIATE_CONTACT',
+    'HIGH': 'SCHEDULE_FOLLOWUP',
+    'MEDIUM': 'ADD_TO_NURTURE',
+    'LOW': 'MONITOR'
+}
+
+
+class _AnalysisCache:
+    """
+    Persistent content-hash cache for per-lead analysis results.
+    
+    Scheduled 5 AM runs re-encounter most county-records rows day over
+    day; keying by a hash of the scraped raw_data lets repeat leads skip
+    the Vision Cortex and Vertex AI calls entirely.
+    """
+    
+    TTL_SECONDS = 7 * 24 * 3600
+    
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analysis_cache ("
+            "key TEXT PRIMARY KEY, value BLOB, created_at REAL)"
+        )
+        # Age out stale entries so a changed property re-analyzes
+        self._conn.execute(
+            "DELETE FROM analysis_cache WHERE created_at < ?",
+            (time.time() - self.TTL_SECONDS,)
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def key_for(lead: RawLead) -> str:
+        raw = orjson.dumps(
+            lead.raw_data, option=orjson.OPT_SORT_KEYS, default=str
+        )
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        row = self._conn.execute(
+            "SELECT value FROM analysis_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+    
+    def put(self, key: str, value: Dict):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO analysis_cache VALUES (?, ?, ?)",
+            (key, orjson.dumps(value, default=str), time.time())
+        )
+    
+    def flush(self):
+        self._conn.commit()
+    
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+
 class AutonomousPipeline:
     """
     Full Autonomous Lead Generation Pipeline
@@ -123,9 +244,10 @@ class AutonomousPipeline:
     def __init__(self, config: Optional[PipelineConfig] = None):
         self.config = config or PipelineConfig()
         self.run_id = self._generate_run_id()
+        core_mod, scraper_mod, vertex_mod = _components()
         
         # Initialize core components
-        self.manus_core = ManusCore(SystemConfig(
+        self.manus_core = core_mod.ManusCore(core_mod.SystemConfig(
             max_parallel_instances=self.config.max_parallel_scrapers,
             auto_heal_enabled=self.config.auto_heal,
             auto_fix_enabled=self.config.auto_retry,
@@ -134,41 +256,56 @@ class AutonomousPipeline:
         ))
         
         # Initialize scraper orchestrator
-        self.scraper = HeadlessOrchestrator(ScraperConfig(
+        self.scraper = scraper_mod.HeadlessOrchestrator(scraper_mod.ScraperConfig(
             max_instances=self.config.max_parallel_scrapers,
             headless=True,
             stealth_mode=True
         ))
         
         # Initialize Vertex AI components
-        self.vertex_client = VertexAIClient(VertexConfig(
+        self.vertex_client = vertex_mod.VertexAIClient(vertex_mod.VertexConfig(
             enable_automl=True,
             enable_bigquery=self.config.store_to_bigquery,
             enable_firestore=self.config.sync_to_firestore
         ))
-        self.automl_predictor = AutoMLPredictor()
-        self.bigquery = BigQueryAnalytics()
-        self.firestore = FirestoreSync()
+        self.automl_predictor = vertex_mod.AutoMLPredictor()
+        self.bigquery = vertex_mod.BigQueryAnalytics()
+        self.firestore = vertex_mod.FirestoreSync()
         
         # Initialize analysis components
-        self.vision_cortex = VisionCortexIntegration(self.manus_core)
-        self.smart_router = SmartRouter(self.config.local_primary)
-        self.validator = TripleCheckValidator()
+        self.vision_cortex = core_mod.VisionCortexIntegration(self.manus_core)
+        self.smart_router = core_mod.SmartRouter(self.config.local_primary)
+        self.validator = core_mod.TripleCheckValidator()
+        
+        # Analysis result cache (content-addressed, survives across runs)
+        self._analysis_cache = None
+        if self.config.analysis_cache_enabled:
+            self._analysis_cache = _AnalysisCache(
+                f"{self.config.results_path}/.analysis_cache.sqlite3"
+            )
+        
+        # Bytes of the enriched-leads JSON, shared between sinks
+        self._leads_payload: Optional[bytes] = None
         
-        # Pipeline state
+        # Pipeline state. Wall-clock timestamps stay on the result for
+        # display; duration is measured on the monotonic clock, which NTP
+        # slews and DST cannot move mid-run.
         self.result = PipelineResult(
             run_id=self.run_id,
             start_time=datetime.utcnow()
         )
+        self._mono_start = time.monotonic()
+        self._mono_end: Optional[float] = None
         self._running = False
         
         logger.info(f"AutonomousPipeline initialized (run_id={self.run_id})")
     
     def _generate_run_id(self) -> str:
         """Generate unique run ID"""
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        unique = hashlib.md5(str(datetime.utcnow().timestamp()).encode()).hexdigest()[:6]
-        return f"pipeline_{timestamp}_{unique}"
+        # token_hex reads the OS entropy pool directly; the old md5 of a
+        # second datetime.utcnow() cost a full digest and could collide
+        # for runs started in the same clock tick
+        return f"pipeline_{datetime.utcnow():%Y%m%d_%H%M%S}_{secrets.token_hex(3)}"
     
     async def initialize(self):
         """Initialize all pipeline components"""
@@ -176,21 +313,36 @@ class AutonomousPipeline:
         self.result.stage = PipelineStage.INITIALIZATION
         
         try:
-            # Start Manus Core
-            await self.manus_core.start()
-            
-            # Initialize scraper orchestrator
-            await self.scraper.start(self.config.max_parallel_scrapers)
-            
-            # Initialize Vertex AI
-            await self.vertex_client.initialize()
-            await self.automl_predictor.initialize()
-            
-            # Initialize storage
+            # The component bring-ups are independent of each other, so
+            # run them concurrently: init time is the slowest component,
+            # not the sum of browser launches and cloud-client handshakes
+            inits = [
+                ('manus_core', self.manus_core.start()),
+                ('scraper', self.scraper.start(self.config.max_parallel_scrapers)),
+                ('vertex_client', self.vertex_client.initialize()),
+                ('automl_predictor', self.automl_predictor.initialize()),
+            ]
             if self.config.store_to_bigquery:
-                await self.bigquery.initialize()
+                inits.append(('bigquery', self.bigquery.initialize()))
             if self.config.sync_to_firestore:
-                await self.firestore.initialize()
+                inits.append(('firestore', self.firestore.initialize()))
+            
+            outcomes = await asyncio.gather(
+                *(coro for _, coro in inits),
+                return_exceptions=True
+            )
+            
+            # Surface every failed component, then re-raise the first so
+            # run() aborts the same way the serial version did
+            failed = [
+                (name, outcome)
+                for (name, _), outcome in zip(inits, outcomes)
+                if isinstance(outcome, Exception)
+            ]
+            if failed:
+                for name, exc in failed:
+                    logger.error(f"{name} initialization failed: {exc}")
+                raise failed[0][1]
             
             logger.info("Pipeline initialization complete")
             
@@ -215,67 +367,32 @@ class AutonomousPipeline:
         self._running = True
         
         try:
-            # Initialize if not already done
+            # Initialize once - retries below re-run the stages, not the
+            # component bring-up
             await self.initialize()
             
             # Use default targets if none provided
             if not targets:
                 targets = self._get_default_targets()
             
-            # Stage 1: Scraping
-            logger.info("Stage 1: Scraping")
-            self.result.stage = PipelineStage.SCRAPING
-            raw_leads = await self._execute_scraping(targets)
-            self.result.leads_scraped = len(raw_leads)
-            
-            # Stage 2: Validation
-            logger.info("Stage 2: Validation")
-            self.result.stage = PipelineStage.VALIDATION
-            validated_leads = await self._execute_validation(raw_leads)
-            self.result.leads_validated = len(validated_leads)
-            
-            # Stage 3: Analysis
-            logger.info("Stage 3: Analysis")
-            self.result.stage = PipelineStage.ANALYSIS
-            analyzed_leads = await self._execute_analysis(validated_leads)
-            self.result.leads_analyzed = len(analyzed_leads)
-            
-            # Stage 4: Scoring
-            logger.info("Stage 4: Scoring")
-            self.result.stage = PipelineStage.SCORING
-            scored_leads = await self._execute_scoring(analyzed_leads)
-            
-            # Stage 5: Enrichment
-            logger.info("Stage 5: Enrichment")
-            self.result.stage = PipelineStage.ENRICHMENT
-            enriched_leads = await self._execute_enrichment(scored_leads)
-            
-            # Stage 6: Storage
-            logger.info("Stage 6: Storage")
-            self.result.stage = PipelineStage.STORAGE
-            await self._execute_storage(enriched_leads)
-            self.result.leads_stored = len(enriched_leads)
-            
-            # Stage 7: Reporting
-            logger.info("Stage 7: Reporting")
-            self.result.stage = PipelineStage.REPORTING
-            await self._execute_reporting(enriched_leads)
-            
-            # Complete
-            self.result.stage = PipelineStage.COMPLETE
-            self.result.end_time = datetime.utcnow()
-            self.result.metrics = self._gather_metrics()
-            
-            logger.info(f"Pipeline complete: {self.result.leads_stored} leads processed")
-            
+            # Iterative retry: the old recursive self.run() call re-entered
+            # initialize() and _cleanup() on every attempt and gated on the
+            # total error count, so stage warnings from earlier attempts
+            # silently consumed retry budget
+            attempts = self.config.max_retries if self.config.auto_retry else 0
+            for attempt in range(attempts + 1):
+                try:
+                    await self._run_stages(targets)
+                    break
+                except Exception as e:
+                    logger.error(f"Pipeline execution error: {e}")
+                    self.result.errors.append(str(e))
+                    if attempt < attempts:
+                        logger.info(f"Auto-retrying pipeline (attempt {attempt + 2}/{attempts + 1})...")
+        
         except Exception as e:
             logger.error(f"Pipeline execution error: {e}")
             self.result.errors.append(str(e))
-            
-            # Auto-retry if enabled
-            if self.config.auto_retry and len(self.result.errors) < self.config.max_retries:
-                logger.info("Auto-retrying pipeline...")
-                return await self.run(targets)
         
         finally:
             self._running = False
@@ -283,7 +400,63 @@ class AutonomousPipeline:
         
         return self.result
     
-    async def _execute_scraping(self, targets: List[ScrapeTarget]) -> List[Dict]:
+    async def _run_stages(self, targets: List[ScrapeTarget]):
+        """Run the pipeline stages for a single attempt"""
+        # Stage 1: Scraping
+        logger.info("Stage 1: Scraping")
+        self.result.stage = PipelineStage.SCRAPING
+        raw_leads = await self._execute_scraping(targets)
+        self.result.leads_scraped = len(raw_leads)
+        
+        # Stages 2 + 3: Validation streamed into Analysis. These were
+        # full barriers - every lead finished validating before the first
+        # analysis call went out. A bounded queue now feeds leads to
+        # analysis as they pass validation, overlapping the two
+        # network-bound stages. Later stages keep the materialized list:
+        # scoring's vectorized sort and the single-file writers need all
+        # rows, and the intermediate lists are pointer arrays over the
+        # same mutated dicts, so streaming them would save overlap, not
+        # bytes.
+        logger.info("Stages 2-3: Validation streaming into Analysis")
+        self.result.stage = PipelineStage.VALIDATION
+        self.result.leads_validated = 0
+        self.result.leads_analyzed = 0
+        analyzed_leads = await self._stream_validate_analyze(raw_leads)
+        
+        # Stage 4: Scoring
+        logger.info("Stage 4: Scoring")
+        self.result.stage = PipelineStage.SCORING
+        scored_leads = await self._execute_scoring(analyzed_leads)
+        
+        # Stage 5: Enrichment
+        logger.info("Stage 5: Enrichment")
+        self.result.stage = PipelineStage.ENRICHMENT
+        enriched_leads = await self._execute_enrichment(scored_leads)
+        
+        # Leads cross into the sinks as plain dicts - the cloud writers
+        # and serializers all expect mappings
+        lead_rows = [lead.to_dict() for lead in enriched_leads]
+        
+        # Stage 6: Storage
+        logger.info("Stage 6: Storage")
+        self.result.stage = PipelineStage.STORAGE
+        await self._execute_storage(lead_rows)
+        self.result.leads_stored = len(lead_rows)
+        
+        # Stage 7: Reporting
+        logger.info("Stage 7: Reporting")
+        self.result.stage = PipelineStage.REPORTING
+        await self._execute_reporting(lead_rows)
+        
+        # Complete
+        self.result.stage = PipelineStage.COMPLETE
+        self.result.end_time = datetime.utcnow()
+        self._mono_end = time.monotonic()
+        self.result.metrics = self._gather_metrics()
+        
+        logger.info(f"Pipeline complete: {self.result.leads_stored} leads processed")
+    
+    async def _execute_scraping(self, targets: List[ScrapeTarget]) -> List[RawLead]:
         """Execute parallel scraping"""
         results = await self.scraper.scrape_parallel(targets)
         
@@ -291,168 +464,261 @@ class AutonomousPipeline:
         leads = []
         for result in results:
             if result.success and result.data:
-                lead = {
-                    'id': f"lead_{result.target_id}",
-                    'source_url': result.url,
-                    'raw_data': result.data,
-                    'scraped_at': result.timestamp.isoformat(),
-                    'scrape_time_ms': result.execution_time_ms
-                }
-                leads.append(lead)
+                leads.append(RawLead(
+                    id=f"lead_{result.target_id}",
+                    source_url=result.url,
+                    raw_data=result.data,
+                    scraped_at=result.timestamp.isoformat(),
+                    scrape_time_ms=result.execution_time_ms
+                ))
         
         return leads
     
-    async def _execute_validation(self, leads: List[Dict]) -> List[Dict]:
-        """Execute triple-check validation"""
-        if not self.config.triple_check_enabled:
-            return leads
+    async def _stream_validate_analyze(self, leads: List[RawLead]) -> List[RawLead]:
+        """Stream leads from validation into analysis
         
-        validated = []
-        for lead in leads:
-            result = await self.validator.validate(lead, 'lead')
-            if result['confidence'] >= self.config.min_confidence_threshold * 100:
-                lead['validation'] = result
-                validated.append(lead)
+        Validation fans out under one semaphore and pushes passing leads
+        into a bounded queue; the consumer takes an analysis slot before
+        spawning each task, capping in-flight analyses. The queue's
+        maxsize is the backpressure: when analysis is the slower stage
+        the consumer stalls on the semaphore, the queue fills and
+        validators block on put() instead of racing ahead.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.batch_size * 2)
+        min_confidence = self.config.min_confidence_threshold * 100
+        validate_sem = asyncio.Semaphore(self.config.max_parallel_analysis)
+        analyze_sem = asyncio.Semaphore(self.config.max_parallel_analysis)
+        cache = self._analysis_cache
+        
+        async def validate_one(lead):
+            try:
+                async with validate_sem:
+                    result = await self.validator.validate(lead, 'lead')
+            except Exception as e:
+                self.result.errors.append(f"Validation: {e}")
+                return
+            if result['confidence'] >= min_confidence:
+                lead.validation = result
+                self.result.leads_validated += 1
+                await queue.put(lead)
+        
+        async def produce():
+            if self.config.triple_check_enabled:
+                await asyncio.gather(*(validate_one(lead) for lead in leads))
+            else:
+                for lead in leads:
+                    self.result.leads_validated += 1
+                    await queue.put(lead)
+            await queue.put(None)  # end-of-stream sentinel
+        
+        analyzed: List[RawLead] = []
+        
+        async def analyze_one(lead):
+            # The consumer loop acquired the analyze_sem slot for us
+            try:
+                await self._analyze_lead(lead, cache)
+            except Exception as e:
+                self.result.errors.append(f"Analysis: {e}")
+                return
+            finally:
+                analyze_sem.release()
+            analyzed.append(lead)
+            self.result.leads_analyzed += 1
+        
+        producer = asyncio.create_task(produce())
+        pending: set = set()
+        
+        while True:
+            lead = await queue.get()
+            if lead is None:
+                break
+            self.result.stage = PipelineStage.ANALYSIS
+            # Acquire before create_task: an unbounded spawn here grew
+            # in-flight tasks O(N) and put() never actually blocked
+            await analyze_sem.acquire()
+            task = asyncio.create_task(analyze_one(lead))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
         
-        return validated
-    
-    async def _execute_analysis(self, leads: List[Dict]) -> List[Dict]:
-        """Execute Vision Cortex + Vertex AI analysis"""
-        analyzed = []
+        if pending:
+            await asyncio.gather(*pending)
+        await producer
         
-        # Parallel analysis using Manus MAP
-        async def analyze_lead(lead):
-            # Vision Cortex analysis
-            vision_analysis = await self.vision_cortex.analyze_signal(lead)
-            
-            # Vertex AI analysis
-            vertex_analysis = await self.vertex_client.analyze_lead(lead)
-            
-            lead['vision_cortex'] = vision_analysis
-            lead['vertex_ai'] = vertex_analysis
-            return lead
-        
-        results = await self.manus_core.map_parallel(
-            analyze_lead,
-            leads,
-            max_concurrent=self.config.max_parallel_analysis
-        )
-        
-        for result in results:
-            if result.success:
-                analyzed.append(result.data)
+        if cache:
+            cache.flush()
         
         return analyzed
     
-    async def _execute_scoring(self, leads: List[Dict]) -> List[Dict]:
+    async def _analyze_lead(self, lead: RawLead, cache: Optional[_AnalysisCache]):
+        """Run Vision Cortex + Vertex AI analysis for a single lead"""
+        # Repeat leads (same raw_data content) reuse yesterday's
+        # analysis instead of re-spending both API calls
+        key = cache.key_for(lead) if cache else None
+        if key:
+            cached = cache.get(key)
+            if cached:
+                lead.vision_cortex = cached['vision_cortex']
+                lead.vertex_ai = cached['vertex_ai']
+                return
+        
+        lead.vision_cortex = await self.vision_cortex.analyze_signal(lead)
+        lead.vertex_ai = await self.vertex_client.analyze_lead(lead)
+        if key:
+            cache.put(key, {
+                'vision_cortex': lead.vision_cortex,
+                'vertex_ai': lead.vertex_ai
+            })
+    
+    async def _execute_scoring(self, leads: List[RawLead]) -> List[RawLead]:
         """Execute AutoML scoring"""
         predictions = await self.automl_predictor.batch_predict(leads)
         
         for lead, prediction in zip(leads, predictions):
-            lead['ml_score'] = prediction.prediction
-            lead['ml_confidence'] = prediction.confidence
-            lead['model_version'] = prediction.model_version
+            lead.ml_score = prediction.prediction
+            lead.ml_confidence = prediction.confidence
+            lead.model_version = prediction.model_version
+        
+        if not leads:
+            return leads
         
-        # Sort by score
-        leads.sort(key=lambda x: x.get('ml_score', 0), reverse=True)
+        # Vectorize priority binning and the sort: one np.select pass and
+        # one argsort over contiguous float32 arrays replaces the per-lead
+        # if/elif chain and the keyed Python sort
+        scores = np.fromiter(
+            (lead.ml_score for lead in leads),
+            dtype=np.float32, count=len(leads)
+        )
+        confidences = np.fromiter(
+            (lead.ml_confidence for lead in leads),
+            dtype=np.float32, count=len(leads)
+        )
+        priorities = np.select(
+            [(scores >= 80) & (confidences >= 0.8), scores >= 70, scores >= 50],
+            ['CRITICAL', 'HIGH', 'MEDIUM'],
+            default='LOW'
+        )
+        for lead, priority in zip(leads, priorities):
+            lead.priority = str(priority)
+        
+        # Sort by score (descending, stable so equal scores keep scrape order)
+        order = np.argsort(-scores, kind='stable')
+        leads[:] = [leads[i] for i in order]
         
         return leads
     
-    async def _execute_enrichment(self, leads: List[Dict]) -> List[Dict]:
+    async def _execute_enrichment(self, leads: List[RawLead]) -> List[RawLead]:
         """Execute data enrichment"""
+        # One timestamp and one dict lookup per lead - the old loop called
+        # utcnow().isoformat() per lead and went through a method that
+        # rebuilt the action table on each call (priority itself is
+        # assigned vectorized in the scoring stage)
+        now_iso = datetime.utcnow().isoformat()
+        get_action = _ACTION_BY_PRIORITY.get
         for lead in leads:
-            # Add computed fields
-            lead['priority'] = self._calculate_priority(lead)
-            lead['recommended_action'] = self._get_recommended_action(lead)
-            lead['enriched_at'] = datetime.utcnow().isoformat()
+            lead.recommended_action = get_action(lead.priority, 'MONITOR')
+            lead.enriched_at = now_iso
         
         return leads
     
-    def _calculate_priority(self, lead: Dict) -> str:
-        """Calculate lead priority"""
-        score = lead.get('ml_score', 0)
-        confidence = lead.get('ml_confidence', 0)
-        
-        if score >= 80 and confidence >= 0.8:
-            return "CRITICAL"
-        elif score >= 70:
-            return "HIGH"
-        elif score >= 50:
-            return "MEDIUM"
-        else:
-            return "LOW"
-    
-    def _get_recommended_action(self, lead: Dict) -> str:
-        """Get recommended action for lead"""
-        priority = lead.get('priority', 'LOW')
-        
-        actions = {
-            'CRITICAL': 'IMMEDIATE_CONTACT',
-            'HIGH': 'SCHEDULE_FOLLOWUP',
-            'MEDIUM': 'ADD_TO_NURTURE',
-            'LOW': 'MONITOR'
-        }
-        
-        return actions.get(priority, 'MONITOR')
+    # Per-sink cap so one hung destination cannot stall the stage forever
+    STORAGE_TIMEOUT_SECONDS = 120
     
     async def _execute_storage(self, leads: List[Dict]):
         """Execute storage to all configured destinations"""
-        # Local storage
+        # The sinks are independent, so write them concurrently instead of
+        # local, then BigQuery, then Firestore back to back. A failed or
+        # timed-out sink is recorded without blocking the others.
+        sinks = []
         if self.config.save_to_local:
-            await self._save_local(leads)
-        
-        # BigQuery storage
+            # Serialize the full lead list exactly once per attempt; the
+            # local sink writes these bytes instead of re-encoding
+            self._leads_payload = orjson.dumps(
+                leads, option=orjson.OPT_INDENT_2, default=str
+            )
+            sinks.append(('local', self._save_local(leads)))
         if self.config.store_to_bigquery:
-            await self.bigquery.store_leads(leads)
-        
-        # Firestore sync
+            sinks.append(('bigquery', self.bigquery.store_leads(leads)))
         if self.config.sync_to_firestore:
-            await self.firestore.batch_sync(leads)
+            sinks.append(('firestore', self.firestore.batch_sync(leads)))
+        
+        if not sinks:
+            return
+        
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(coro, timeout=self.STORAGE_TIMEOUT_SECONDS)
+              for _, coro in sinks),
+            return_exceptions=True
+        )
+        
+        for (name, _), outcome in zip(sinks, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Storage sink '{name}' failed: {outcome}")
+                self.result.errors.append(f"Storage ({name}): {outcome}")
     
     async def _save_local(self, leads: List[Dict]):
         """Save leads to local filesystem"""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         
-        # Save JSON
+        # Save JSON without stalling the loop: orjson serializes in C
+        # (3-5x stdlib json) and aiofiles keeps the write off-thread, so
+        # concurrent Firestore/BigQuery tasks keep running. An io_uring
+        # submission queue would batch these writes without the thread
+        # hop, but that needs a native extension and a Linux-only kernel
+        # API; for two files per run the thread-pool write is already far
+        # off the critical path, so this tree stays pure-pip.
         json_path = f"{self.config.results_path}/leads/leads_{timestamp}.json"
         os.makedirs(os.path.dirname(json_path), exist_ok=True)
-        with open(json_path, 'w') as f:
-            json.dump(leads, f, indent=2, default=str)
+        payload = self._leads_payload
+        if payload is None:
+            payload = orjson.dumps(leads, option=orjson.OPT_INDENT_2, default=str)
+        async with aiofiles.open(json_path, 'wb') as f:
+            await f.write(payload)
         
-        # Save CSV
+        # The csv module is sync end to end; run it on a worker thread
         csv_path = f"{self.config.results_path}/leads/leads_{timestamp}.csv"
-        self._save_csv(leads, csv_path)
+        await asyncio.to_thread(self._save_csv, leads, csv_path)
         
         logger.info(f"Saved {len(leads)} leads to {json_path}")
     
     def _save_csv(self, leads: List[Dict], path: str):
         """Save leads to CSV"""
-        import csv
-        
         if not leads:
             return
         
-        # Flatten nested dicts for CSV
-        flat_leads = []
-        for lead in leads:
-            flat = {}
-            for key, value in lead.items():
-                if isinstance(value, dict):
-                    for sub_key, sub_value in value.items():
-                        flat[f"{key}_{sub_key}"] = sub_value
-                else:
-                    flat[key] = value
-            flat_leads.append(flat)
-        
-        # Get all keys
-        all_keys = set()
-        for lead in flat_leads:
-            all_keys.update(lead.keys())
-        
-        with open(path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=sorted(all_keys))
-            writer.writeheader()
-            writer.writerows(flat_leads)
+        # json_normalize flattens the nested dicts and to_csv writes
+        # through pandas' C serializer - the old path flattened per-lead
+        # in Python, unioned the keys in a second pass, then fed
+        # csv.DictWriter one dict at a time
+        df = pd.json_normalize(leads, sep='_')
+        df = df.reindex(columns=self._csv_columns(df.columns))
+        df.to_csv(path, index=False)
+    
+    def _csv_columns(self, columns) -> List[str]:
+        """Return the persisted CSV column order, extended with new keys
+        
+        The lead schema barely changes between daily runs, so the column
+        list is cached under results_path instead of being rediscovered
+        and re-sorted every time. Unseen keys append at the end, which
+        keeps column positions stable for anything diffing or importing
+        consecutive exports.
+        """
+        schema_path = f"{self.config.results_path}/.csv_schema.json"
+        known: List[str] = []
+        try:
+            with open(schema_path, 'rb') as f:
+                known = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            pass
+        
+        known_set = set(known)
+        new_cols = sorted(c for c in columns if c not in known_set)
+        if new_cols:
+            known = known + new_cols
+            os.makedirs(os.path.dirname(schema_path), exist_ok=True)
+            with open(schema_path, 'wb') as f:
+                f.write(orjson.dumps(known))
+        
+        return known
     
     async def _execute_reporting(self, leads: List[Dict]):
         """Generate pipeline reports"""
@@ -473,8 +739,8 @@ class AutonomousPipeline:
         # Save report
         report_path = f"{self.config.results_path}/reports/report_{self.run_id}.json"
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        async with aiofiles.open(report_path, 'wb') as f:
+            await f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str))
         
         logger.info(f"Report saved to {report_path}")
     
@@ -491,14 +757,19 @@ class AutonomousPipeline:
                 'leads_stored': self.result.leads_stored,
                 'errors': len(self.result.errors),
                 'duration_seconds': (
-                    (self.result.end_time - self.result.start_time).total_seconds()
-                    if self.result.end_time else None
+                    self._mono_end - self._mono_start
+                    if self._mono_end is not None else None
                 )
             }
         }
     
     def _get_default_targets(self) -> List[ScrapeTarget]:
         """Get default scraping targets"""
+        _, scraper_mod, _ = _components()
+        ScrapeTarget = scraper_mod.ScrapeTarget
+        SiteType = scraper_mod.SiteType
+        ScraperMode = scraper_mod.ScraperMode
+        
         return [
             # Treasure Coast targets
             ScrapeTarget(
@@ -546,6 +817,8 @@ class AutonomousPipeline:
         try:
             await self.scraper.stop()
             await self.manus_core.stop()
+            if self._analysis_cache:
+                self._analysis_cache.close()
             logger.info("Pipeline cleanup complete")
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
@@ -561,38 +834,53 @@ class ScheduledPipelineRunner:
     
     def __init__(self, config: Optional[PipelineConfig] = None):
         self.config = config or PipelineConfig()
+        # Parse the schedule once instead of re-splitting the string on
+        # every wakeup
+        hour, minute = map(int, self.config.schedule_time.split(':'))
+        self._schedule_hour = hour
+        self._schedule_minute = minute
+        self._tz = ZoneInfo(self.config.schedule_timezone)
         self._running = False
+        self._stop_event = asyncio.Event()
         self._next_run: Optional[datetime] = None
         logger.info(f"ScheduledPipelineRunner initialized (schedule: {self.config.schedule_time})")
     
     async def start(self):
         """Start the scheduled runner"""
         self._running = True
+        self._stop_event.clear()
         logger.info("Scheduled runner started")
         
         while self._running:
             # Calculate next run time
             self._next_run = self._calculate_next_run()
             
-            # Wait until next run
-            wait_seconds = (self._next_run - datetime.utcnow()).total_seconds()
+            # Wait until next run; stop() trips the event so shutdown is
+            # immediate instead of sleeping out the remaining hours
+            wait_seconds = (self._next_run - datetime.now(self._tz)).total_seconds()
             if wait_seconds > 0:
                 logger.info(f"Next run scheduled for {self._next_run} ({wait_seconds:.0f}s)")
-                await asyncio.sleep(wait_seconds)
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=wait_seconds)
+                    break
+                except asyncio.TimeoutError:
+                    pass
             
             # Execute pipeline
             if self._running:
                 await self._execute_scheduled_run()
     
     def _calculate_next_run(self) -> datetime:
-        """Calculate next scheduled run time"""
-        now = datetime.utcnow()
-        
-        # Parse schedule time
-        hour, minute = map(int, self.config.schedule_time.split(':'))
-        
-        # Calculate next run
-        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        """Calculate next scheduled run time in the configured timezone"""
+        # The 5 AM contract is schedule_timezone local time; the old
+        # utcnow() math fired at 05:00 UTC (midnight or 1 AM Eastern,
+        # depending on DST)
+        now = datetime.now(self._tz)
+        
+        next_run = now.replace(
+            hour=self._schedule_hour, minute=self._schedule_minute,
+            second=0, microsecond=0
+        )
         
         # If time has passed today, schedule for tomorrow
         if next_run <= now:
@@ -616,6 +904,7 @@ class ScheduledPipelineRunner:
     def stop(self):
         """Stop the scheduled runner"""
         self._running = False
+        self._stop_event.set()
         logger.info("Scheduled runner stopped")
 
 
@@ -11,20 +11,35 @@ Implements the universal headless scraper system with:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
 import random
+import time
 import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Callable
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Callable
 from enum import Enum
 
 logger = logging.getLogger('HeadlessScraper')
 
 
+@functools.lru_cache(maxsize=4096)
+def _target_id(url: str) -> str:
+    """12-char target id for a URL
+    
+    md5 ran its full compression over the URL and hex-encoded 32 chars
+    only to keep 12; blake2b with a 6-byte digest emits exactly the
+    needed width, and the cache makes repeat scrapes of the same URL
+    free.
+    """
+    return hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
+
+
 class ScraperMode(Enum):
     """Scraper operation modes"""
     CRAWL = "crawl"
@@ -51,6 +66,7 @@ class SiteType(Enum):
 class ScraperConfig:
     """Configuration for headless scraper instances"""
     max_instances: int = 100
+    browser_share_ratio: int = 10  # instances per shared browser process
     headless: bool = True
     timeout_seconds: int = 30
     retry_attempts: int = 3
@@ -95,12 +111,19 @@ class HeadlessInstance:
     form filling, and extraction capabilities.
     """
     
-    def __init__(self, instance_id: str, config: ScraperConfig):
+    def __init__(self, instance_id: str, config: ScraperConfig,
+                 shared_browser=None):
         self.instance_id = instance_id
         self.config = config
         self.browser = None
+        self.context = None
         self.page = None
+        self._shared_browser = shared_browser
+        self._owns_browser = False
         self._active = False
+        # Locator objects keyed by selector string - Playwright re-parses
+        # the selector on every page.query_selector call otherwise
+        self._locator_cache: Dict[str, Any] = {}
         
         # User agent pool for rotation
         self.user_agents = [
@@ -114,23 +137,30 @@ class HeadlessInstance:
     async def initialize(self):
         """Initialize the browser instance"""
         try:
-            # Import playwright dynamically
-            from playwright.async_api import async_playwright
-            
-            self._playwright = await async_playwright().start()
-            
-            # Launch browser with stealth settings
-            launch_options = {
-                'headless': self.config.headless,
-                'args': [
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox'
-                ]
-            }
-            
-            self.browser = await self._playwright.chromium.launch(**launch_options)
+            if self._shared_browser is not None:
+                # Attach to a pooled browser: context-per-instance keeps
+                # cookie/session isolation while sharing the renderer and
+                # network subprocesses with browser_share_ratio siblings
+                self.browser = self._shared_browser
+            else:
+                # Import playwright dynamically
+                from playwright.async_api import async_playwright
+                
+                self._playwright = await async_playwright().start()
+                
+                # Launch browser with stealth settings
+                launch_options = {
+                    'headless': self.config.headless,
+                    'args': [
+                        '--disable-blink-features=AutomationControlled',
+                        '--disable-dev-shm-usage',
+                        '--no-sandbox',
+                        '--disable-setuid-sandbox'
+                    ]
+                }
+                
+                self.browser = await self._playwright.chromium.launch(**launch_options)
+                self._owns_browser = True
             
             # Create context with random user agent
             context_options = {}
@@ -171,12 +201,20 @@ class HeadlessInstance:
                 });
             """)
     
-    async def navigate(self, url: str) -> bool:
-        """Navigate to a URL"""
+    async def navigate(self, url: str, ready_selector: Optional[str] = None) -> bool:
+        """Navigate to a URL, optionally waiting for a readiness selector"""
         try:
             if self.page:
-                await self.page.goto(url, timeout=self.config.timeout_seconds * 1000)
-                await self.page.wait_for_load_state('networkidle')
+                timeout_ms = self.config.timeout_seconds * 1000
+                if ready_selector:
+                    # Extraction only needs its selectors to exist;
+                    # 'networkidle' waited for 500ms of network silence
+                    # that tracker-heavy listing sites can postpone for
+                    # 10-30 seconds
+                    await self.page.goto(url, wait_until='domcontentloaded', timeout=timeout_ms)
+                    await self.page.wait_for_selector(ready_selector, timeout=timeout_ms)
+                else:
+                    await self.page.goto(url, wait_until='load', timeout=timeout_ms)
                 return True
             return True  # Mock mode
         except Exception as e:
@@ -206,6 +244,19 @@ class HeadlessInstance:
             logger.error(f"Click error: {e}")
             return False
     
+    _LOCATOR_CACHE_MAX = 512
+    
+    def _locator(self, selector: str):
+        """Return a cached Locator for a selector string"""
+        loc = self._locator_cache.get(selector)
+        if loc is None:
+            if len(self._locator_cache) >= self._LOCATOR_CACHE_MAX:
+                # Simple FIFO eviction keeps the cache bounded
+                self._locator_cache.pop(next(iter(self._locator_cache)))
+            loc = self.page.locator(selector)
+            self._locator_cache[selector] = loc
+        return loc
+    
     async def extract(self, selectors: Dict[str, str]) -> Dict[str, Any]:
         """Extract data using selectors"""
         results = {}
@@ -214,9 +265,14 @@ class HeadlessInstance:
             if self.page:
                 for key, selector in selectors.items():
                     try:
-                        element = await self.page.query_selector(selector)
-                        if element:
-                            results[key] = await element.text_content()
+                        # all_text_contents returns [] for no match without
+                        # waiting out a timeout like locator.text_content.
+                        # Keys are only set on a hit so a page where every
+                        # selector misses yields a falsy dict, which the
+                        # orchestrator treats as a failed scrape.
+                        texts = await self._locator(selector).all_text_contents()
+                        if texts:
+                            results[key] = texts[0]
                     except:
                         results[key] = None
             else:
@@ -235,17 +291,21 @@ class HeadlessInstance:
         
         try:
             if self.page:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    item = {}
-                    for key, sub_selector in item_selectors.items():
-                        try:
-                            sub_element = await element.query_selector(sub_selector)
-                            if sub_element:
-                                item[key] = await sub_element.text_content()
-                        except:
-                            item[key] = None
-                    items.append(item)
+                # One evaluate() walks every row inside the browser - a
+                # single CDP round-trip instead of one per row x field.
+                # Scoping each query to its row keeps fields aligned even
+                # when a row is missing one of them (the per-column
+                # all_text_contents batching silently shifted values up
+                # into earlier rows in that case).
+                items = await self.page.evaluate(
+                    """([selector, fields]) =>
+                        Array.from(document.querySelectorAll(selector)).map(row =>
+                            Object.fromEntries(Object.entries(fields).map(([key, sub]) => {
+                                const el = row.querySelector(sub);
+                                return [key, el ? el.textContent : null];
+                            })))""",
+                    [selector, item_selectors]
+                )
         except Exception as e:
             logger.error(f"Extract all error: {e}")
         
@@ -266,7 +326,8 @@ class HeadlessInstance:
                 await self.page.close()
             if self.context:
                 await self.context.close()
-            if self.browser:
+            # Shared browsers are owned by the orchestrator pool
+            if self.browser and self._owns_browser:
                 await self.browser.close()
             if hasattr(self, '_playwright'):
                 await self._playwright.stop()
@@ -288,6 +349,8 @@ class HeadlessOrchestrator:
         self.config = config or ScraperConfig()
         self.instances: Dict[str, HeadlessInstance] = {}
         self._instance_pool: asyncio.Queue = asyncio.Queue()
+        self._browsers: List[Any] = []
+        self._playwright = None
         self._running = False
         self._metrics = {
             'total_scrapes': 0,
@@ -306,17 +369,53 @@ class HeadlessOrchestrator:
         
         logger.info(f"Starting {num_instances} headless instances...")
         
+        # Launch a small pool of real browsers and hand them out round-
+        # robin: 100 instances no longer fork 100 Chromium processes
+        # (GBs of RSS and a CPU spike at startup) - instances share one
+        # browser per browser_share_ratio workers and isolate state in
+        # their own contexts
+        await self._launch_browser_pool(num_instances)
+        
         # Initialize instances in parallel
         init_tasks = []
         for i in range(num_instances):
             instance_id = f"scraper-{i:04d}"
-            instance = HeadlessInstance(instance_id, self.config)
+            shared = (
+                self._browsers[i % len(self._browsers)]
+                if self._browsers else None
+            )
+            instance = HeadlessInstance(instance_id, self.config, shared_browser=shared)
             init_tasks.append(self._init_instance(instance))
         
         await asyncio.gather(*init_tasks)
         
         logger.info(f"Orchestrator started with {len(self.instances)} instances")
     
+    async def _launch_browser_pool(self, num_instances: int):
+        """Launch ceil(num_instances / browser_share_ratio) shared browsers"""
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            logger.warning("Playwright not available, instances run in mock mode")
+            return
+        
+        self._playwright = await async_playwright().start()
+        num_browsers = -(-num_instances // max(self.config.browser_share_ratio, 1))
+        launch_options = {
+            'headless': self.config.headless,
+            'args': [
+                '--disable-blink-features=AutomationControlled',
+                '--disable-dev-shm-usage',
+                '--no-sandbox',
+                '--disable-setuid-sandbox'
+            ]
+        }
+        self._browsers = list(await asyncio.gather(*[
+            self._playwright.chromium.launch(**launch_options)
+            for _ in range(num_browsers)
+        ]))
+        logger.info(f"Launched {len(self._browsers)} shared browsers")
+    
     async def _init_instance(self, instance: HeadlessInstance):
         """Initialize a single instance and add to pool"""
         await instance.initialize()
@@ -333,21 +432,35 @@ class HeadlessOrchestrator:
         ]
         await asyncio.gather(*cleanup_tasks)
         
+        # Instances only close their contexts; the pooled browsers are
+        # torn down here
+        for browser in self._browsers:
+            await browser.close()
+        self._browsers.clear()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        
         self.instances.clear()
         logger.info("Orchestrator stopped")
     
     async def scrape(self, target: ScrapeTarget) -> ScrapeResult:
         """Execute a single scrape operation"""
-        start_time = datetime.utcnow()
-        target_id = hashlib.md5(target.url.encode()).hexdigest()[:12]
+        # Monotonic integer clock for the latency figure - datetime
+        # construction allocates an object per reading and can move with
+        # the wall clock; the result timestamp stays a datetime
+        t0 = time.perf_counter_ns()
+        target_id = _target_id(target.url)
         
         # Get an available instance
         instance_id = await self._instance_pool.get()
         instance = self.instances[instance_id]
         
         try:
-            # Navigate to URL
-            nav_success = await instance.navigate(target.url)
+            # Navigate to URL, using the first extraction selector as the
+            # page-ready signal
+            ready_selector = next(iter(target.selectors.values()), None)
+            nav_success = await instance.navigate(target.url, ready_selector)
             if not nav_success:
                 raise Exception("Navigation failed")
             
@@ -364,7 +477,7 @@ class HeadlessOrchestrator:
             else:
                 data = {}
             
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            execution_time = (time.perf_counter_ns() - t0) / 1e6
             
             self._metrics['total_scrapes'] += 1
             self._metrics['successful_scrapes'] += 1
@@ -380,7 +493,7 @@ class HeadlessOrchestrator:
             )
             
         except Exception as e:
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            execution_time = (time.perf_counter_ns() - t0) / 1e6
             
             self._metrics['total_scrapes'] += 1
             self._metrics['failed_scrapes'] += 1
@@ -407,30 +520,38 @@ class HeadlessOrchestrator:
         """Execute multiple scrapes in parallel"""
         logger.info(f"Starting parallel scrape of {len(targets)} targets")
         
-        # Use semaphore to limit concurrent scrapes
-        semaphore = asyncio.Semaphore(len(self.instances))
+        # Worker-pool model: gathering one coroutine per target kept every
+        # pending future alive at once, so memory grew with the target
+        # list. A fixed crew of instance-count workers drains a queue of
+        # (index, target) pairs instead - memory stays constant on
+        # 100k-URL runs, and the instance pool is the concurrency bound
+        # (it blocks workers from any number of overlapping calls)
+        in_q: asyncio.Queue = asyncio.Queue()
+        for i, target in enumerate(targets):
+            in_q.put_nowait((i, target))
         
-        async def bounded_scrape(target):
-            async with semaphore:
-                return await self.scrape(target)
+        results: List[Optional[ScrapeResult]] = [None] * len(targets)
         
-        results = await asyncio.gather(
-            *[bounded_scrape(target) for target in targets],
-            return_exceptions=True
-        )
+        async def worker():
+            while True:
+                try:
+                    i, target = in_q.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[i] = await self.scrape(target)
+                except Exception as e:
+                    results[i] = ScrapeResult(
+                        target_id=f"error-{i}",
+                        url=target.url,
+                        success=False,
+                        error=str(e)
+                    )
         
-        # Convert exceptions to results
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                final_results.append(ScrapeResult(
-                    target_id=f"error-{i}",
-                    url=targets[i].url,
-                    success=False,
-                    error=str(result)
-                ))
-            else:
-                final_results.append(result)
+        num_workers = max(1, min(len(self.instances), len(targets)))
+        await asyncio.gather(*(worker() for _ in range(num_workers)))
+        
+        final_results = [r for r in results if r is not None]
         
         success_count = sum(1 for r in final_results if r.success)
         logger.info(f"Parallel scrape complete: {success_count}/{len(targets)} succeeded")
@@ -451,6 +572,83 @@ class HeadlessOrchestrator:
         }
 
 
+# Site adapter tables, built once at import: get_adapter used to rebuild
+# this whole literal (and its nested dicts) on every call, which sat on
+# the per-target hot path. MappingProxyType keeps the shared tables
+# read-only so one caller cannot mutate another's adapter.
+_DEFAULT_ADAPTER: Mapping[str, Any] = MappingProxyType({
+    'rate_limit_ms': 1000,
+    'selectors': {},
+    'pagination': None
+})
+_ADAPTERS: Dict[SiteType, Mapping[str, Any]] = {
+    SiteType.GOVERNMENT: MappingProxyType({
+        'rate_limit_ms': 2000,
+        'selectors': {
+            'property_list': '.property-listing',
+            'address': '.address',
+            'status': '.status',
+            'date': '.date'
+        },
+        'pagination': {
+            'next_button': '.pagination .next',
+            'max_pages': 100
+        }
+    }),
+    SiteType.AUCTION: MappingProxyType({
+        'rate_limit_ms': 1500,
+        'selectors': {
+            'auction_item': '.auction-item',
+            'price': '.current-bid',
+            'end_date': '.auction-end',
+            'property_info': '.property-details'
+        },
+        'pagination': {
+            'next_button': 'a.next-page',
+            'max_pages': 50
+        }
+    }),
+    SiteType.REAL_ESTATE: MappingProxyType({
+        'rate_limit_ms': 1000,
+        'selectors': {
+            'listing': '.listing-card',
+            'price': '.price',
+            'address': '.address',
+            'beds': '.beds',
+            'baths': '.baths',
+            'sqft': '.sqft'
+        },
+        'pagination': {
+            'next_button': '.pagination-next',
+            'max_pages': 200
+        }
+    }),
+    SiteType.COUNTY_RECORDS: MappingProxyType({
+        'rate_limit_ms': 3000,
+        'selectors': {
+            'record': '.record-row',
+            'parcel_id': '.parcel-id',
+            'owner': '.owner-name',
+            'value': '.assessed-value'
+        },
+        'form_fields': {
+            'search_input': '#search-input',
+            'submit_button': '#search-submit'
+        }
+    }),
+    SiteType.SOCIAL_MEDIA: MappingProxyType({
+        'rate_limit_ms': 2000,
+        'selectors': {
+            'post': '.post',
+            'content': '.post-content',
+            'author': '.author',
+            'date': '.post-date'
+        },
+        'stealth_required': True
+    })
+}
+
+
 class SiteAdapterFactory:
     """
     Factory for creating site-specific adapters
@@ -460,80 +658,9 @@ class SiteAdapterFactory:
     """
     
     @staticmethod
-    def get_adapter(site_type: SiteType) -> Dict[str, Any]:
+    def get_adapter(site_type: SiteType) -> Mapping[str, Any]:
         """Get site-specific configuration"""
-        adapters = {
-            SiteType.GOVERNMENT: {
-                'rate_limit_ms': 2000,
-                'selectors': {
-                    'property_list': '.property-listing',
-                    'address': '.address',
-                    'status': '.status',
-                    'date': '.date'
-                },
-                'pagination': {
-                    'next_button': '.pagination .next',
-                    'max_pages': 100
-                }
-            },
-            SiteType.AUCTION: {
-                'rate_limit_ms': 1500,
-                'selectors': {
-                    'auction_item': '.auction-item',
-                    'price': '.current-bid',
-                    'end_date': '.auction-end',
-                    'property_info': '.property-details'
-                },
-                'pagination': {
-                    'next_button': 'a.next-page',
-                    'max_pages': 50
-                }
-            },
-            SiteType.REAL_ESTATE: {
-                'rate_limit_ms': 1000,
-                'selectors': {
-                    'listing': '.listing-card',
-                    'price': '.price',
-                    'address': '.address',
-                    'beds': '.beds',
-                    'baths': '.baths',
-                    'sqft': '.sqft'
-                },
-                'pagination': {
-                    'next_button': '.pagination-next',
-                    'max_pages': 200
-                }
-            },
-            SiteType.COUNTY_RECORDS: {
-                'rate_limit_ms': 3000,
-                'selectors': {
-                    'record': '.record-row',
-                    'parcel_id': '.parcel-id',
-                    'owner': '.owner-name',
-                    'value': '.assessed-value'
-                },
-                'form_fields': {
-                    'search_input': '#search-input',
-                    'submit_button': '#search-submit'
-                }
-            },
-            SiteType.SOCIAL_MEDIA: {
-                'rate_limit_ms': 2000,
-                'selectors': {
-                    'post': '.post',
-                    'content': '.post-content',
-                    'author': '.author',
-                    'date': '.post-date'
-                },
-                'stealth_required': True
-            }
-        }
-        
-        return adapters.get(site_type, {
-            'rate_limit_ms': 1000,
-            'selectors': {},
-            'pagination': None
-        })
+        return _ADAPTERS.get(site_type, _DEFAULT_ADAPTER)
 
 
 # Pre-configured scrape targets for lead generation
@@ -10,8 +10,10 @@ Integrates with Manus Core, Vision Cortex, and Vertex AI.
 110% Protocol | FAANG Enterprise-Grade | Zero Human Hands
 """
 
+import asyncio
+import json
 import os
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 import google.generativeai as genai
 
 # Configure AI (only if key is available)
@@ -21,6 +23,33 @@ if os.environ.get("GEMINI_API_KEY"):
 else:
     model = None
 
+# Shared browser: every scrape used to boot its own Chromium (~1-2s and
+# hundreds of MB RSS per call); one process now serves them all, with
+# per-call contexts providing the cookie/session isolation.
+_browser_lock = asyncio.Lock()
+_playwright = None
+_browser = None
+
+async def _get_browser():
+    """Lazily start Playwright once and return the shared browser"""
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is None:
+            _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+    return _browser
+
+async def shutdown_browser():
+    """Close the shared browser and stop Playwright"""
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
 # Integration functions
 def send_to_manus_core(data):
     """Send data to Manus Core for processing"""
@@ -35,62 +64,114 @@ def send_to_vertex_ai(data):
     print(f"Sending to Vertex AI: {data}")
 
 # AI Analysis
-def analyze_listing(listing_details):
+async def analyze_listing(listing_details):
     """Analyze if a listing is a distressed property using AI"""
     if model is None:
         return "Unknown"
     prompt = f"Is the following property listing a distressed property? Analyze the title and description and return 'Yes' or 'No'.\n\n{listing_details}"
-    response = model.generate_content(prompt)
+    response = await model.generate_content_async(prompt)
     return response.text.strip()
 
+async def analyze_listings_batch(titles):
+    """Analyze many listings with a single AI round-trip
+
+    Each per-listing call is a full HTTPS round-trip to Gemini, so a
+    page of 50 listings spent most of its wall clock waiting on the
+    model. One JSON-array prompt classifies the whole page; malformed
+    model output falls back to the per-listing path.
+    """
+    if not titles:
+        return []
+    if model is None:
+        return ["Unknown"] * len(titles)
+    prompt = (
+        "For each property listing title in the following JSON array, decide "
+        "whether it describes a distressed property. Return only a JSON array "
+        "of 'Yes' or 'No' strings, one per title, in the same order.\n\n"
+        + json.dumps(titles)
+    )
+    try:
+        response = await model.generate_content_async(prompt)
+        text = response.text
+        # Tolerate markdown fences around the array
+        start, end = text.find('['), text.rfind(']')
+        verdicts = json.loads(text[start:end + 1])
+        if isinstance(verdicts, list) and len(verdicts) == len(titles):
+            return [str(v).strip() for v in verdicts]
+    except (json.JSONDecodeError, ValueError):
+        pass
+    print("Batch analysis returned malformed output, retrying per listing")
+    return [await analyze_listing(f'Title: {t}') for t in titles]
+
+def _dispatch_distressed(rows, verdicts):
+    """Send listings the AI flagged as distressed to the integrations"""
+    for row, verdict in zip(rows, verdicts):
+        if verdict == 'Yes':
+            send_to_manus_core(row)
+            send_to_vision_cortex(row)
+            send_to_vertex_ai(row)
+
 # Scrapers
-def scrape_facebook_marketplace():
+async def scrape_facebook_marketplace(browser=None):
     """Scrape Facebook Marketplace for distressed properties"""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto("https://www.facebook.com/marketplace/")
-        page.locator('input[aria-label="Search Marketplace"]').fill('distressed properties')
-        page.locator('button[aria-label="Search"]').click()
-        page.wait_for_load_state('networkidle')
-        listings = page.locator("//a[@href^='/marketplace/item/']").all()
-        for listing in listings:
-            title = listing.locator("//span[contains(@style, 'text-transform: none;')]").inner_text()
-            price = listing.locator("//div[contains(@style, 'font-weight: 700;')]").inner_text()
-            link = listing.get_attribute('href')
-            analysis = analyze_listing(f'Title: {title}')
-            if analysis == 'Yes':
-                data = {'title': title, 'price': price, 'link': link, 'source': 'Facebook Marketplace'}
-                send_to_manus_core(data)
-                send_to_vision_cortex(data)
-                send_to_vertex_ai(data)
-        browser.close()
-
-def scrape_craigslist():
+    browser = browser or await _get_browser()
+    context = await browser.new_context()
+    page = await context.new_page()
+    try:
+        await page.goto("https://www.facebook.com/marketplace/")
+        await page.locator('input[aria-label="Search Marketplace"]').fill('distressed properties')
+        await page.locator('button[aria-label="Search"]').click()
+        await page.wait_for_load_state('networkidle')
+        # One evaluate() collects every listing inside the browser - the
+        # old loop paid three CDP round-trips per listing just to read
+        # title, price and link
+        rows = await page.evaluate("""() =>
+            Array.from(document.querySelectorAll("a[href^='/marketplace/item/']")).map(el => ({
+                title: el.querySelector("span[style*='text-transform: none']")?.innerText,
+                price: el.querySelector("div[style*='font-weight: 700']")?.innerText,
+                link: el.getAttribute('href')
+            }))""")
+        for row in rows:
+            row['source'] = 'Facebook Marketplace'
+        verdicts = await analyze_listings_batch([row['title'] for row in rows])
+        _dispatch_distressed(rows, verdicts)
+    finally:
+        await context.close()
+
+async def scrape_craigslist(browser=None):
     """Scrape Craigslist for distressed properties"""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto("https://www.craigslist.org/about/sites")
-        page.locator('a:has-text("new york")').first.click()
-        page.locator('#query').fill('distressed properties')
-        page.get_by_role('button', name='search').click()
-        page.wait_for_load_state('networkidle')
-        listings = page.locator("//li[@class='cl-search-result']").all()
-        for listing in listings:
-            title = listing.locator("//a[@class='posting-title']").inner_text()
-            price = listing.locator("//span[@class='priceinfo']").inner_text()
-            link = listing.locator("//a[@class='posting-title']").get_attribute("href")
-            analysis = analyze_listing(f'Title: {title}')
-            if analysis == 'Yes':
-                data = {'title': title, 'price': price, 'link': link, 'source': 'Craigslist'}
-                send_to_manus_core(data)
-                send_to_vision_cortex(data)
-                send_to_vertex_ai(data)
-        browser.close()
+    browser = browser or await _get_browser()
+    context = await browser.new_context()
+    page = await context.new_page()
+    try:
+        await page.goto("https://www.craigslist.org/about/sites")
+        await page.locator('a:has-text("new york")').first.click()
+        await page.locator('#query').fill('distressed properties')
+        await page.get_by_role('button', name='search').click()
+        await page.wait_for_load_state('networkidle')
+        # Single in-browser pass over the result list instead of three
+        # CDP round-trips per listing
+        rows = await page.evaluate("""() =>
+            Array.from(document.querySelectorAll("li.cl-search-result")).map(el => ({
+                title: el.querySelector("a.posting-title")?.innerText,
+                price: el.querySelector("span.priceinfo")?.innerText,
+                link: el.querySelector("a.posting-title")?.getAttribute("href")
+            }))""")
+        for row in rows:
+            row['source'] = 'Craigslist'
+        verdicts = await analyze_listings_batch([row['title'] for row in rows])
+        _dispatch_distressed(rows, verdicts)
+    finally:
+        await context.close()
+
+async def main():
+    """Run both scrapers concurrently on the shared browser"""
+    try:
+        await asyncio.gather(scrape_facebook_marketplace(), scrape_craigslist())
+    finally:
+        await shutdown_browser()
 
 if __name__ == '__main__':
     print("Starting Social Media Scraper...")
-    scrape_facebook_marketplace()
-    scrape_craigslist()
+    asyncio.run(main())
     print("Social Media Scraper finished.")
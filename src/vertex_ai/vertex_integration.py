@@ -11,9 +11,11 @@ Implements:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -460,24 +462,56 @@ class BigQueryAnalytics:
         except Exception as e:
             logger.error(f"BigQuery initialization error: {e}")
     
+    # Rows per insert_rows_json request: large enough to be bandwidth-
+    # bound instead of request-latency-bound, small enough to stay well
+    # under the streaming request size cap.
+    INSERT_CHUNK = 500
+    
     async def store_leads(self, leads: List[Dict], table_name: str = "leads"):
-        """Store leads in BigQuery"""
+        """Store leads in BigQuery as pipelined 500-row inserts"""
         if not self._client:
             logger.warning("BigQuery not initialized, skipping storage")
             return
         
         try:
             table_id = f"{self.config.project_id}.lead_sniper.{table_name}"
-            errors = self._client.insert_rows_json(table_id, leads)
-            
-            if errors:
-                logger.error(f"BigQuery insert errors: {errors}")
-            else:
-                logger.info(f"Stored {len(leads)} leads in BigQuery")
-                
+            await asyncio.gather(*[
+                self._insert_chunk(table_id, leads[i:i + self.INSERT_CHUNK])
+                for i in range(0, len(leads), self.INSERT_CHUNK)
+            ])
+            logger.info(f"Stored {len(leads)} leads in BigQuery")
         except Exception as e:
             logger.error(f"BigQuery storage error: {e}")
     
+    async def _insert_chunk(self, table_id: str, rows: List[Dict]):
+        """Insert one chunk off-loop, retrying transient unavailability"""
+        try:
+            from google.api_core import exceptions as api_exceptions
+            transient = (api_exceptions.ServiceUnavailable,)
+        except ImportError:
+            transient = ()
+        
+        # Lead IDs double as insert IDs so a retried chunk dedupes
+        # server-side instead of writing duplicate rows
+        row_ids = [row.get('id') for row in rows]
+        loop = asyncio.get_running_loop()
+        
+        for attempt in range(3):
+            try:
+                errors = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        self._client.insert_rows_json, table_id, rows, row_ids=row_ids
+                    )
+                )
+                if errors:
+                    logger.error(f"BigQuery insert errors: {errors}")
+                return
+            except transient:
+                if attempt == 2:
+                    raise
+                await asyncio.sleep(0.5 * (2 ** attempt))
+    
     async def query_leads(self, query: str) -> List[Dict]:
         """Query leads from BigQuery"""
         if not self._client:
@@ -541,21 +575,55 @@ class FirestoreSync:
         except Exception as e:
             logger.error(f"Firestore sync error: {e}")
     
+    # Firestore caps a WriteBatch at 500 writes (and ~10MiB per request);
+    # oversized batches fail outright and unchunked syncs of large lead
+    # sets hit Deadline Exceeded.
+    BATCH_LIMIT = 500
+    MAX_CONCURRENT_BATCHES = 10
+    
     async def batch_sync(self, leads: List[Dict]):
-        """Batch sync leads to Firestore"""
+        """Batch sync leads to Firestore in concurrent 500-doc chunks"""
         if not self._db:
             return
         
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+        
+        async def commit_chunk(chunk):
+            async with semaphore:
+                # The Firestore client is sync; keep its network wait off
+                # the event loop
+                await asyncio.to_thread(self._commit_chunk, chunk)
+        
         try:
-            batch = self._db.batch()
-            for lead in leads:
-                doc_ref = self._db.collection('leads').document(lead.get('id'))
-                batch.set(doc_ref, lead, merge=True)
-            batch.commit()
+            await asyncio.gather(*[
+                commit_chunk(leads[i:i + self.BATCH_LIMIT])
+                for i in range(0, len(leads), self.BATCH_LIMIT)
+            ])
             logger.info(f"Batch synced {len(leads)} leads to Firestore")
         except Exception as e:
             logger.error(f"Firestore batch sync error: {e}")
     
+    def _commit_chunk(self, chunk: List[Dict]):
+        """Commit one WriteBatch, retrying transient commit conflicts"""
+        try:
+            from google.api_core import exceptions as api_exceptions
+            transient = (api_exceptions.Aborted, api_exceptions.Conflict)
+        except ImportError:
+            transient = ()
+        
+        for attempt in range(3):
+            batch = self._db.batch()
+            for lead in chunk:
+                doc_ref = self._db.collection('leads').document(lead.get('id'))
+                batch.set(doc_ref, lead, merge=True)
+            try:
+                batch.commit()
+                return
+            except transient:
+                if attempt == 2:
+                    raise
+                time.sleep(0.2 * (2 ** attempt))
+    
     def listen_for_changes(self, callback):
         """Listen for real-time changes"""
         if not self._db:
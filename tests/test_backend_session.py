@@ -0,0 +1,35 @@
+'''
+# Regression test for the backend scoped-session lifecycle
+
+The async_scoped_session is keyed to the endpoint's asyncio task. If the
+teardown middleware runs remove() in a different task (the old
+BaseHTTPMiddleware behavior), the registry keeps one AsyncSession per
+request forever. This exercises a real request through the ASGI stack
+and asserts the registry is empty afterwards.
+'''
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+httpx = pytest.importorskip("httpx")
+
+from backend.combined_backend import DbSession, app, create_tables
+
+
+def test_session_registry_empty_after_request():
+    async def scenario():
+        await create_tables()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/leads/")
+            assert response.status_code == 200
+        assert not DbSession.registry.registry
+
+    asyncio.run(scenario())